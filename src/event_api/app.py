@@ -1,6 +1,7 @@
 from flask import Flask
 from .config import Config
 from .limiter import limiter
+from . import profiling
 from .routes import api_bp
 
 def create_app(config_class=Config):
@@ -8,6 +9,7 @@ def create_app(config_class=Config):
     app.config.from_object(config_class)
     
     limiter.init_app(app)
+    profiling.init_app(app)
     
     app.register_blueprint(api_bp)
     
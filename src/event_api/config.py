@@ -3,3 +3,9 @@ import os
 class Config:
     SECRET_KEY = os.environ.get('SECRET_KEY') or 'dev-secret-key'
     API_KEY = os.environ.get('API_KEY') or 'secret-api-key'
+
+    # Opt-in profiling: allow ?debug_timing=1 breakdowns, and cProfile a
+    # fraction (0.0-1.0) of requests into PROFILE_DIR
+    DEBUG_TIMING_ENABLED = os.environ.get('DEBUG_TIMING_ENABLED', '').lower() in ('1', 'true', 'yes')
+    PROFILE_SAMPLE_RATE = float(os.environ.get('PROFILE_SAMPLE_RATE') or 0.0)
+    PROFILE_DIR = os.environ.get('PROFILE_DIR') or 'profiles'
@@ -0,0 +1,130 @@
+import cProfile
+import os
+import random
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from flask import current_app, request, g
+
+# Per-thread list of (stage, seconds); None when timing is not active for the
+# current request, so stage() costs a single attribute lookup when disabled.
+_local = threading.local()
+
+# On Python 3.12+ cProfile is interpreter-wide and a second enable() raises,
+# so only one sampled request is profiled at a time.
+_profiler_lock = threading.Lock()
+
+
+def start_timing():
+    """Begin collecting stage timings for the current thread"""
+    _local.timings = []
+
+
+def stop_timing():
+    """Stop collecting and return the recorded (stage, seconds) pairs"""
+    timings = getattr(_local, "timings", None)
+    _local.timings = None
+    return timings or []
+
+
+@contextmanager
+def stage(name):
+    """Record the wall time of the wrapped block when timing is active"""
+    timings = getattr(_local, "timings", None)
+    if timings is None:
+        yield
+        return
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings.append((name, time.perf_counter() - started))
+
+
+def timing_breakdown():
+    """Return the timings recorded so far for this request, in milliseconds,
+    with a trailing elapsed-so-far total"""
+    timings = list(getattr(_local, "timings", None) or [])
+    started = g.get("timing_started")
+    if started is not None:
+        timings.append(("total", time.perf_counter() - started))
+    return [{"stage": name, "ms": round(seconds * 1000, 3)} for name, seconds in timings]
+
+
+def timing_requested():
+    """Whether the current request asked for a timing breakdown"""
+    return getattr(g, "debug_timing", False)
+
+
+def _server_timing(timings):
+    return ", ".join(f"{name};dur={seconds * 1000:.3f}" for name, seconds in timings)
+
+
+def _before_request():
+    config = current_app.config
+
+    g.debug_timing = config.get("DEBUG_TIMING_ENABLED") and request.args.get("debug_timing") == "1"
+    if g.debug_timing:
+        start_timing()
+        g.timing_started = time.perf_counter()
+
+    rate = config.get("PROFILE_SAMPLE_RATE") or 0.0
+    if rate > 0 and random.random() < rate:
+        _start_profiler()
+
+
+def _start_profiler():
+    if not _profiler_lock.acquire(blocking=False):
+        return
+    profiler = cProfile.Profile()
+    try:
+        profiler.enable()
+    except ValueError:
+        # Another profiling tool (debugger, coverage) is active; skip sampling
+        _profiler_lock.release()
+        return
+    g.profiler = profiler
+
+
+def _stop_profiler():
+    profiler = g.pop("profiler", None)
+    if profiler is not None:
+        try:
+            profiler.disable()
+        finally:
+            _profiler_lock.release()
+    return profiler
+
+
+def _after_request(response):
+    profiler = _stop_profiler()
+    if profiler is not None:
+        profile_dir = current_app.config.get("PROFILE_DIR") or "profiles"
+        try:
+            os.makedirs(profile_dir, exist_ok=True)
+            filename = f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{request.endpoint or 'unknown'}-{os.getpid()}-{threading.get_ident()}.prof"
+            profiler.dump_stats(os.path.join(profile_dir, filename))
+        except OSError as e:
+            print(f"Profiling error: {e}")
+
+    if g.get("debug_timing"):
+        timings = stop_timing()
+        timings.append(("total", time.perf_counter() - g.timing_started))
+        response.headers["Server-Timing"] = _server_timing(timings)
+    return response
+
+
+def _teardown_request(exc):
+    # after_request is skipped on unhandled errors; never leak state to the next request
+    _stop_profiler()
+    stop_timing()
+
+
+def init_app(app):
+    """Register the opt-in timing and sampling hooks on a Flask app"""
+    if not app.config.get("DEBUG_TIMING_ENABLED") and not app.config.get("PROFILE_SAMPLE_RATE"):
+        return
+    app.before_request(_before_request)
+    app.after_request(_after_request)
+    app.teardown_request(_teardown_request)
@@ -2,6 +2,7 @@ from flask import Blueprint, request, jsonify
 from .auth import require_api_key
 from .services.scraper import UnifiedEventService
 from .limiter import limiter
+from .profiling import timing_requested, timing_breakdown
 
 api_bp = Blueprint('api', __name__, url_prefix='/api/v1')
 scraper = UnifiedEventService()
@@ -18,10 +19,13 @@ def get_events():
         
     try:
         events = scraper.get_events(location, category)
-        return jsonify({
+        body = {
             "status": "success",
             "count": len(events),
             "data": events
-        })
+        }
+        if timing_requested():
+            body["timing"] = timing_breakdown()
+        return jsonify(body)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
@@ -1,6 +1,7 @@
 import requests
 from datetime import datetime
 import os
+from ..profiling import stage
 
 class EventProvider:
     def search(self, **kwargs):
@@ -87,49 +88,52 @@ class EventbriteProvider(EventProvider):
         
         
         try:
-            response = self.session.post(self.base_url, json=payload)
-            response.raise_for_status()
-            data = response.json()
+            with stage("eventbrite.http"):
+                response = self.session.post(self.base_url, json=payload)
+                response.raise_for_status()
+            with stage("eventbrite.json"):
+                data = response.json()
             
             events = []
-            for item in data.get("events", {}).get("results", []):
-                venue = item.get("primary_venue") or {}
-                venue_addr = venue.get("address") or {}
-                ticket = item.get("ticket_availability") or {}
-                image = item.get("image") or {}
-                organizer = item.get("primary_organizer") or {}
+            with stage("eventbrite.normalize"):
+                for item in data.get("events", {}).get("results", []):
+                    venue = item.get("primary_venue") or {}
+                    venue_addr = venue.get("address") or {}
+                    ticket = item.get("ticket_availability") or {}
+                    image = item.get("image") or {}
+                    organizer = item.get("primary_organizer") or {}
                 
-                # Price formatting
-                is_free = ticket.get("is_free", False)
-                min_price = "Free"
-                max_price = "Free"
-                if not is_free:
-                    min_ticket = ticket.get("minimum_ticket_price") or {}
-                    max_ticket = ticket.get("maximum_ticket_price") or {}
-                    min_price = self._format_price(min_ticket.get("display", ""), is_free)
-                    max_price = self._format_price(max_ticket.get("display", ""), is_free)
+                    # Price formatting
+                    is_free = ticket.get("is_free", False)
+                    min_price = "Free"
+                    max_price = "Free"
+                    if not is_free:
+                        min_ticket = ticket.get("minimum_ticket_price") or {}
+                        max_ticket = ticket.get("maximum_ticket_price") or {}
+                        min_price = self._format_price(min_ticket.get("display", ""), is_free)
+                        max_price = self._format_price(max_ticket.get("display", ""), is_free)
                 
-                events.append({
-                    "event_id": str(item.get("id", "")),
-                    "title": item.get("name", ""),
-                    "description": item.get("summary", ""),
-                    "start_datetime": item.get("start_date", ""),
-                    "end_datetime": item.get("end_date", ""),
-                    "timezone": item.get("timezone", "UTC"),
-                    "venue_name": venue.get("name", ""),
-                    "venue_city": venue_addr.get("city", ""),
-                    "venue_country": venue_addr.get("country", ""),
-                    "latitude": venue_addr.get("latitude", 0.0),
-                    "longitude": venue_addr.get("longitude", 0.0),
-                    "organizer_name": organizer.get("name", ""),
-                    "ticket_min_price": min_price,
-                    "ticket_max_price": max_price,
-                    "is_free": is_free,
-                    "categories": [tag.get("display_name", "") for tag in (item.get("tags") or [])],
-                    "image_url": (image.get("original") or {}).get("url", ""),
-                    "event_url": item.get("url", ""),
-                    "source": "eventbrite"
-                })
+                    events.append({
+                        "event_id": str(item.get("id", "")),
+                        "title": item.get("name", ""),
+                        "description": item.get("summary", ""),
+                        "start_datetime": item.get("start_date", ""),
+                        "end_datetime": item.get("end_date", ""),
+                        "timezone": item.get("timezone", "UTC"),
+                        "venue_name": venue.get("name", ""),
+                        "venue_city": venue_addr.get("city", ""),
+                        "venue_country": venue_addr.get("country", ""),
+                        "latitude": venue_addr.get("latitude", 0.0),
+                        "longitude": venue_addr.get("longitude", 0.0),
+                        "organizer_name": organizer.get("name", ""),
+                        "ticket_min_price": min_price,
+                        "ticket_max_price": max_price,
+                        "is_free": is_free,
+                        "categories": [tag.get("display_name", "") for tag in (item.get("tags") or [])],
+                        "image_url": (image.get("original") or {}).get("url", ""),
+                        "event_url": item.get("url", ""),
+                        "source": "eventbrite"
+                    })
             return events
         except Exception as e:
             print(f"Eventbrite error: {e}")
@@ -178,36 +182,39 @@ class MeetupProvider(EventProvider):
         }
 
         try:
-            response = requests.post(self.url, headers=headers, json={'query': gql_query, 'variables': variables})
-            response.raise_for_status()
-            data = response.json()
+            with stage("meetup.http"):
+                response = requests.post(self.url, headers=headers, json={'query': gql_query, 'variables': variables})
+                response.raise_for_status()
+            with stage("meetup.json"):
+                data = response.json()
             
             events = []
-            edges = data.get("data", {}).get("keywordSearch", {}).get("edges", [])
-            for edge in edges:
-                node = edge["node"]
-                venue = node.get("venue") or {}
-                events.append({
-                    "event_id": str(node.get("id", "")),
-                    "title": node.get("title", ""),
-                    "description": node.get("description", ""),
-                    "start_datetime": node.get("dateTime", ""),
-                    "end_datetime": "",
-                    "timezone": "UTC",
-                    "venue_name": venue.get("name", ""),
-                    "venue_city": venue.get("city", ""),
-                    "venue_country": "",
-                    "latitude": 0.0,
-                    "longitude": 0.0,
-                    "organizer_name": "",
-                    "ticket_min_price": "Free",
-                    "ticket_max_price": "Free",
-                    "is_free": True,
-                    "categories": [],
-                    "image_url": "",
-                    "event_url": node.get("eventUrl", ""),
-                    "source": "meetup"
-                })
+            with stage("meetup.normalize"):
+                edges = data.get("data", {}).get("keywordSearch", {}).get("edges", [])
+                for edge in edges:
+                    node = edge["node"]
+                    venue = node.get("venue") or {}
+                    events.append({
+                        "event_id": str(node.get("id", "")),
+                        "title": node.get("title", ""),
+                        "description": node.get("description", ""),
+                        "start_datetime": node.get("dateTime", ""),
+                        "end_datetime": "",
+                        "timezone": "UTC",
+                        "venue_name": venue.get("name", ""),
+                        "venue_city": venue.get("city", ""),
+                        "venue_country": "",
+                        "latitude": 0.0,
+                        "longitude": 0.0,
+                        "organizer_name": "",
+                        "ticket_min_price": "Free",
+                        "ticket_max_price": "Free",
+                        "is_free": True,
+                        "categories": [],
+                        "image_url": "",
+                        "event_url": node.get("eventUrl", ""),
+                        "source": "meetup"
+                    })
             return events
         except Exception as e:
             print(f"Meetup error: {e}")
@@ -244,89 +251,92 @@ class AllEventsProvider(EventProvider):
         }
 
         try:
-            response = requests.post(self.url, headers=headers, json=json_data, cookies=cookies)
-            response.raise_for_status()
-            # Guard against empty or non-JSON responses for better debugging
-            if not response.text.strip():
-                print(f"AllEvents: empty response body (status {response.status_code}) for city={city}, category={category}")
-                return []
-            try:
-                data = response.json()
-            except Exception as parse_err:
-                preview = response.text[:200].replace("\n", " ")
-                print(f"AllEvents: non-JSON response ({parse_err}), status {response.status_code}, preview: {preview!r}")
-                return []
+            with stage("allevents.http"):
+                response = requests.post(self.url, headers=headers, json=json_data, cookies=cookies)
+                response.raise_for_status()
+            with stage("allevents.json"):
+                # Guard against empty or non-JSON responses for better debugging
+                if not response.text.strip():
+                    print(f"AllEvents: empty response body (status {response.status_code}) for city={city}, category={category}")
+                    return []
+                try:
+                    data = response.json()
+                except Exception as parse_err:
+                    preview = response.text[:200].replace("\n", " ")
+                    print(f"AllEvents: non-JSON response ({parse_err}), status {response.status_code}, preview: {preview!r}")
+                    return []
             
             events = []
-            items = data.get("events") or data.get("global_events") or []
-            for item in items:
-                venue = item.get("venue", {})
-                ticket = item.get("ticket", {})
+            with stage("allevents.normalize"):
+                items = data.get("events") or data.get("global_events") or []
+                for item in items:
+                    venue = item.get("venue", {})
+                    ticket = item.get("ticket", {})
                 
-                # Parse ticket pricing
-                min_price = "Free"
-                max_price = "Free"
-                is_free = True
-                if ticket.get("has_tickets", False):
-                    min_val = ticket.get("min_ticket_price", "0.00")
-                    max_val = ticket.get("max_ticket_price", "0.00")
-                    try:
-                        min_float = float(min_val) if min_val else 0.0
-                        max_float = float(max_val) if max_val else 0.0
-                        if min_float > 0 or max_float > 0:
-                            is_free = False
-                            currency = ticket.get("ticket_currency", "")
-                            min_price = f"{currency} {min_float:g}" if currency else f"{min_float:g}"
-                            max_price = f"{currency} {max_float:g}" if currency else f"{max_float:g}"
-                    except (ValueError, TypeError):
-                        pass
+                    # Parse ticket pricing
+                    min_price = "Free"
+                    max_price = "Free"
+                    is_free = True
+                    if ticket.get("has_tickets", False):
+                        min_val = ticket.get("min_ticket_price", "0.00")
+                        max_val = ticket.get("max_ticket_price", "0.00")
+                        try:
+                            min_float = float(min_val) if min_val else 0.0
+                            max_float = float(max_val) if max_val else 0.0
+                            if min_float > 0 or max_float > 0:
+                                is_free = False
+                                currency = ticket.get("ticket_currency", "")
+                                min_price = f"{currency} {min_float:g}" if currency else f"{min_float:g}"
+                                max_price = f"{currency} {max_float:g}" if currency else f"{max_float:g}"
+                        except (ValueError, TypeError):
+                            pass
                 
-                # Parse start time (Unix timestamp)
-                start_time = item.get("start_time", "")
-                start_datetime = ""
-                if start_time:
+                    # Parse start time (Unix timestamp)
+                    start_time = item.get("start_time", "")
+                    start_datetime = ""
+                    if start_time:
+                        try:
+                            start_datetime = datetime.fromtimestamp(int(start_time)).isoformat()
+                        except (ValueError, TypeError):
+                            start_datetime = item.get("start_time_display", "")
+                
+                    # Get venue coordinates
+                    venue_lat = 0.0
+                    venue_lon = 0.0
                     try:
-                        start_datetime = datetime.fromtimestamp(int(start_time)).isoformat()
+                        venue_lat = float(venue.get("latitude", 0)) if venue.get("latitude") else 0.0
+                        venue_lon = float(venue.get("longitude", 0)) if venue.get("longitude") else 0.0
                     except (ValueError, TypeError):
-                        start_datetime = item.get("start_time_display", "")
-                
-                # Get venue coordinates
-                venue_lat = 0.0
-                venue_lon = 0.0
-                try:
-                    venue_lat = float(venue.get("latitude", 0)) if venue.get("latitude") else 0.0
-                    venue_lon = float(venue.get("longitude", 0)) if venue.get("longitude") else 0.0
-                except (ValueError, TypeError):
-                    pass
+                        pass
                 
-                events.append({
-                    "event_id": str(item.get("event_id", "")),
-                    "title": item.get("eventname", ""),
-                    "description": venue.get("full_address", ""),
-                    "start_datetime": start_datetime or item.get("start_time_display", ""),
-                    "end_datetime": "",
-                    "timezone": "UTC",
-                    "venue_name": item.get("location", ""),
-                    "venue_city": venue.get("city", city),
-                    "venue_country": venue.get("country", ""),
-                    "latitude": venue_lat,
-                    "longitude": venue_lon,
-                    "organizer_name": "",
-                    "ticket_min_price": min_price,
-                    "ticket_max_price": max_price,
-                    "is_free": is_free,
-                    "categories": [],
-                    "image_url": item.get("banner_url", item.get("thumb_url", "")),
-                    "event_url": item.get("event_url", ""),
-                    "source": "allevents"
-                })
-            # Keep only events matching the requested city
-            target_city = city.strip().lower()
-            events = [
-                e for e in events
-                if str(e.get("venue_city", "")).strip().lower() == target_city
-            ]
-            # Cap at 20 events for consistency
+                    events.append({
+                        "event_id": str(item.get("event_id", "")),
+                        "title": item.get("eventname", ""),
+                        "description": venue.get("full_address", ""),
+                        "start_datetime": start_datetime or item.get("start_time_display", ""),
+                        "end_datetime": "",
+                        "timezone": "UTC",
+                        "venue_name": item.get("location", ""),
+                        "venue_city": venue.get("city", city),
+                        "venue_country": venue.get("country", ""),
+                        "latitude": venue_lat,
+                        "longitude": venue_lon,
+                        "organizer_name": "",
+                        "ticket_min_price": min_price,
+                        "ticket_max_price": max_price,
+                        "is_free": is_free,
+                        "categories": [],
+                        "image_url": item.get("banner_url", item.get("thumb_url", "")),
+                        "event_url": item.get("event_url", ""),
+                        "source": "allevents"
+                    })
+                # Keep only events matching the requested city
+                target_city = city.strip().lower()
+                events = [
+                    e for e in events
+                    if str(e.get("venue_city", "")).strip().lower() == target_city
+                ]
+                # Cap at 20 events for consistency
             events = events[:20]
             return events
         except Exception as e:
@@ -352,51 +362,54 @@ class TicketmasterProvider(EventProvider):
         }
 
         try:
-            response = requests.get(self.url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            with stage("ticketmaster.http"):
+                response = requests.get(self.url, params=params)
+                response.raise_for_status()
+            with stage("ticketmaster.json"):
+                data = response.json()
             
             events = []
-            embedded = data.get("_embedded", {})
-            for item in embedded.get("events", []):
-                venue = item.get("_embedded", {}).get("venues", [{}])[0]
-                venue_location = venue.get("location", {})
-                images = item.get("images", [])
-                image_url = images[0].get("url", "") if images else ""
-                price_ranges = item.get("priceRanges", [])
+            with stage("ticketmaster.normalize"):
+                embedded = data.get("_embedded", {})
+                for item in embedded.get("events", []):
+                    venue = item.get("_embedded", {}).get("venues", [{}])[0]
+                    venue_location = venue.get("location", {})
+                    images = item.get("images", [])
+                    image_url = images[0].get("url", "") if images else ""
+                    price_ranges = item.get("priceRanges", [])
                 
-                min_price = "Free"
-                max_price = "Free"
-                is_free = True
-                if price_ranges:
-                    min_val = price_ranges[0].get("min", 0)
-                    max_val = price_ranges[0].get("max", 0)
-                    if min_val > 0:
-                        is_free = False
-                        min_price = f"{min_val:g}"
-                        max_price = f"{max_val:g}"
+                    min_price = "Free"
+                    max_price = "Free"
+                    is_free = True
+                    if price_ranges:
+                        min_val = price_ranges[0].get("min", 0)
+                        max_val = price_ranges[0].get("max", 0)
+                        if min_val > 0:
+                            is_free = False
+                            min_price = f"{min_val:g}"
+                            max_price = f"{max_val:g}"
                 
-                events.append({
-                    "event_id": str(item.get("id", "")),
-                    "title": item.get("name", ""),
-                    "description": item.get("info", ""),
-                    "start_datetime": item.get("dates", {}).get("start", {}).get("localDate", ""),
-                    "end_datetime": "",
-                    "timezone": item.get("dates", {}).get("timezone", "UTC"),
-                    "venue_name": venue.get("name", ""),
-                    "venue_city": venue.get("city", {}).get("name", ""),
-                    "venue_country": venue.get("country", {}).get("countryCode", ""),
-                    "latitude": float(venue_location.get("latitude", 0.0)),
-                    "longitude": float(venue_location.get("longitude", 0.0)),
-                    "organizer_name": "",
-                    "ticket_min_price": min_price,
-                    "ticket_max_price": max_price,
-                    "is_free": is_free,
-                    "categories": [c.get("name", "") for c in item.get("classifications", [])],
-                    "image_url": image_url,
-                    "event_url": item.get("url", ""),
-                    "source": "ticketmaster"
-                })
+                    events.append({
+                        "event_id": str(item.get("id", "")),
+                        "title": item.get("name", ""),
+                        "description": item.get("info", ""),
+                        "start_datetime": item.get("dates", {}).get("start", {}).get("localDate", ""),
+                        "end_datetime": "",
+                        "timezone": item.get("dates", {}).get("timezone", "UTC"),
+                        "venue_name": venue.get("name", ""),
+                        "venue_city": venue.get("city", {}).get("name", ""),
+                        "venue_country": venue.get("country", {}).get("countryCode", ""),
+                        "latitude": float(venue_location.get("latitude", 0.0)),
+                        "longitude": float(venue_location.get("longitude", 0.0)),
+                        "organizer_name": "",
+                        "ticket_min_price": min_price,
+                        "ticket_max_price": max_price,
+                        "is_free": is_free,
+                        "categories": [c.get("name", "") for c in item.get("classifications", [])],
+                        "image_url": image_url,
+                        "event_url": item.get("url", ""),
+                        "source": "ticketmaster"
+                    })
             return events
         except Exception as e:
             print(f"Ticketmaster error: {e}")
@@ -421,35 +434,38 @@ class SerpApiProvider(EventProvider):
         }
 
         try:
-            response = requests.get(self.url, params=params)
-            response.raise_for_status()
-            data = response.json()
+            with stage("serpapi.http"):
+                response = requests.get(self.url, params=params)
+                response.raise_for_status()
+            with stage("serpapi.json"):
+                data = response.json()
             
             events = []
-            for item in data.get("events_results", []):
-                date_info = item.get("date", {})
-                address = item.get("address", [])
-                events.append({
-                    "event_id": str(item.get("link", "")),
-                    "title": item.get("title", ""),
-                    "description": item.get("description", ""),
-                    "start_datetime": date_info.get("start_date", ""),
-                    "end_datetime": date_info.get("end_date", ""),
-                    "timezone": "UTC",
-                    "venue_name": item.get("venue", {}).get("name", ""),
-                    "venue_city": address[0] if len(address) > 0 else "",
-                    "venue_country": "",
-                    "latitude": 0.0,
-                    "longitude": 0.0,
-                    "organizer_name": "",
-                    "ticket_min_price": "Free",
-                    "ticket_max_price": "Free",
-                    "is_free": True,
-                    "categories": [],
-                    "image_url": item.get("thumbnail", ""),
-                    "event_url": item.get("link", ""),
-                    "source": "serpapi"
-                })
+            with stage("serpapi.normalize"):
+                for item in data.get("events_results", []):
+                    date_info = item.get("date", {})
+                    address = item.get("address", [])
+                    events.append({
+                        "event_id": str(item.get("link", "")),
+                        "title": item.get("title", ""),
+                        "description": item.get("description", ""),
+                        "start_datetime": date_info.get("start_date", ""),
+                        "end_datetime": date_info.get("end_date", ""),
+                        "timezone": "UTC",
+                        "venue_name": item.get("venue", {}).get("name", ""),
+                        "venue_city": address[0] if len(address) > 0 else "",
+                        "venue_country": "",
+                        "latitude": 0.0,
+                        "longitude": 0.0,
+                        "organizer_name": "",
+                        "ticket_min_price": "Free",
+                        "ticket_max_price": "Free",
+                        "is_free": True,
+                        "categories": [],
+                        "image_url": item.get("thumbnail", ""),
+                        "event_url": item.get("link", ""),
+                        "source": "serpapi"
+                    })
             return events
         except Exception as e:
             print(f"SerpApi error: {e}")
@@ -474,34 +490,37 @@ class PredictHQProvider(EventProvider):
         }
 
         try:
-            response = requests.get(self.url, headers=headers, params=params)
-            response.raise_for_status()
-            data = response.json()
+            with stage("predicthq.http"):
+                response = requests.get(self.url, headers=headers, params=params)
+                response.raise_for_status()
+            with stage("predicthq.json"):
+                data = response.json()
             
             events = []
-            for item in data.get("results", []):
-                location = item.get("location", [])
-                events.append({
-                    "event_id": str(item.get("id", "")),
-                    "title": item.get("title", ""),
-                    "description": item.get("description", ""),
-                    "start_datetime": item.get("start", ""),
-                    "end_datetime": item.get("end", ""),
-                    "timezone": item.get("timezone", "UTC"),
-                    "venue_name": "",
-                    "venue_city": "",
-                    "venue_country": item.get("country", ""),
-                    "latitude": location[1] if len(location) > 1 else 0.0,
-                    "longitude": location[0] if len(location) > 0 else 0.0,
-                    "organizer_name": "",
-                    "ticket_min_price": "Free",
-                    "ticket_max_price": "Free",
-                    "is_free": True,
-                    "categories": item.get("category", "").split(",") if item.get("category") else [],
-                    "image_url": "",
-                    "event_url": "https://www.predicthq.com",
-                    "source": "predicthq"
-                })
+            with stage("predicthq.normalize"):
+                for item in data.get("results", []):
+                    location = item.get("location", [])
+                    events.append({
+                        "event_id": str(item.get("id", "")),
+                        "title": item.get("title", ""),
+                        "description": item.get("description", ""),
+                        "start_datetime": item.get("start", ""),
+                        "end_datetime": item.get("end", ""),
+                        "timezone": item.get("timezone", "UTC"),
+                        "venue_name": "",
+                        "venue_city": "",
+                        "venue_country": item.get("country", ""),
+                        "latitude": location[1] if len(location) > 1 else 0.0,
+                        "longitude": location[0] if len(location) > 0 else 0.0,
+                        "organizer_name": "",
+                        "ticket_min_price": "Free",
+                        "ticket_max_price": "Free",
+                        "is_free": True,
+                        "categories": item.get("category", "").split(",") if item.get("category") else [],
+                        "image_url": "",
+                        "event_url": "https://www.predicthq.com",
+                        "source": "predicthq"
+                    })
             return events
         except Exception as e:
             print(f"PredictHQ error: {e}")
@@ -1,4 +1,5 @@
 import os
+from ..profiling import stage
 from .geocoding import GeocodingService
 from .providers import EventbriteProvider, MeetupProvider, AllEventsProvider, TicketmasterProvider, SerpApiProvider, PredictHQProvider
 
@@ -23,7 +24,8 @@ class UnifiedEventService:
         location_name = location_name.title()
         
         # 1. Geocode the location
-        lat, lon = self.geocoder.get_coordinates(location_name)
+        with stage("geocode"):
+            lat, lon = self.geocoder.get_coordinates(location_name)
         
         # 2. Fetch from Eventbrite (uses city name, not lat/lon)
         print(f"Fetching Eventbrite for {location_name}...")